@@ -4,178 +4,376 @@ A beautiful Flask web app for analyzing agricultural data
 """
 
 from flask import Flask, render_template, request, jsonify, send_file
+from flask.json.provider import JSONProvider
 import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
 import numpy as np
 from datetime import datetime
-import os
-from werkzeug.utils import secure_filename
 import plotly.graph_objects as go
+from plotly.offline import get_plotlyjs_version
 from plotly.subplots import make_subplots
 import io
 import json
+import math
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+try:
+    import bottleneck as bn
+except ImportError:  # pragma: no cover - bottleneck is optional
+    bn = None
+
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson - much faster on the large
+    figure payloads and serializes NumPy scalars/arrays natively."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
-app.config['UPLOAD_FOLDER'] = 'uploads'
-
-# Create uploads folder if it doesn't exist
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+if orjson is not None:
+    app.json = ORJSONProvider(app)
 
 ALLOWED_EXTENSIONS = {'csv', 'xlsx', 'xls'}
 
+REQUIRED_COLUMNS = ['Date', 'Rainfall_mm', 'Crop_Growth_cm']
+
+# Statistics and figure building are independent and spend most of their
+# time in GIL-releasing C code, so they run concurrently per request
+EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+# Results for recently analyzed files, keyed by content digest, so
+# re-uploading the same file skips the whole parse/aggregate/plot pipeline.
+# Handlers run on multiple threads under gunicorn, so access is locked.
+ANALYSIS_CACHE_SIZE = 32
+_analysis_cache = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+
+def _analysis_cache_get(digest):
+    with _analysis_cache_lock:
+        result = _analysis_cache.get(digest)
+        if result is not None:
+            _analysis_cache.move_to_end(digest)
+        return result
+
+
+def _analysis_cache_put(digest, result):
+    with _analysis_cache_lock:
+        _analysis_cache[digest] = result
+        if len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
+
+
+# Parse dates and numerics in one pass at read time; float32 halves the
+# bytes moved by every downstream reduction
+CSV_READ_KWARGS = dict(
+    dtype={'Rainfall_mm': 'float32', 'Crop_Growth_cm': 'float32'},
+    parse_dates=['Date'],
+)
+
 
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
-def load_data(filepath):
-    """Load CSV or Excel file"""
+def load_data(source, filename=None):
+    """Load CSV or Excel data from a path or file-like object"""
+    name = filename if filename is not None else str(source)
     try:
-        if filepath.endswith('.csv'):
-            df = pd.read_csv(filepath)
+        if name.endswith('.csv'):
+            try:
+                # PyArrow parses CSV in parallel - much faster on large uploads
+                df = pd.read_csv(source, engine='pyarrow', **CSV_READ_KWARGS)
+            except (ImportError, KeyError, ValueError):
+                # Fall back to plain inference for files that don't match the
+                # expected schema (pyarrow raises KeyError for a missing
+                # parse_dates column); validate_data reports them properly
+                if hasattr(source, 'seek'):
+                    source.seek(0)
+                df = pd.read_csv(source)
         else:
-            df = pd.read_excel(filepath)
+            try:
+                # calamine (Rust-backed) is an order of magnitude faster than
+                # openpyxl on big workbooks; only parse the columns we analyze
+                df = pd.read_excel(source, engine='calamine',
+                                   usecols=lambda col: col in REQUIRED_COLUMNS)
+            except ImportError:
+                if hasattr(source, 'seek'):
+                    source.seek(0)
+                df = pd.read_excel(source)
         return df, None
     except Exception as e:
         return None, str(e)
 
 
+def _normalize_column(name):
+    """Normalize a column name for fuzzy matching (case/underscores/units)."""
+    return name.lower().replace('_', '').replace('mm', '').replace('cm', '')
+
+
 def validate_data(df):
     """Validate and clean data"""
     errors = []
     warnings = []
-    
+
     # Check required columns
-    required_columns = ['Date', 'Rainfall_mm', 'Crop_Growth_cm']
-    missing_columns = [col for col in required_columns if col not in df.columns]
-    
+    missing_columns = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+
     if missing_columns:
-        # Try to find similar columns (case-insensitive)
-        available_cols = df.columns.tolist()
-        for req_col in required_columns:
-            if req_col not in df.columns:
-                similar = [col for col in available_cols if req_col.lower().replace('_', '').replace('mm', '').replace('cm', '') 
-                          in col.lower().replace('_', '').replace('mm', '').replace('cm', '')]
-                if not similar:
-                    errors.append(f"Missing required column: {req_col}")
+        # Try to find similar columns (case-insensitive) - normalize every
+        # available column once instead of per required/available pair
+        norm_cols = [_normalize_column(col) for col in df.columns]
+        for req_col in missing_columns:
+            req_norm = _normalize_column(req_col)
+            if not any(req_norm in col for col in norm_cols):
+                errors.append(f"Missing required column: {req_col}")
     
     if errors:
         return None, errors, warnings
     
-    # Handle missing values
-    if df.isnull().any().any():
-        warnings.append(f"Found {df.isnull().sum().sum()} missing values - filling with forward fill")
-        df = df.fillna(method='ffill').fillna(method='bfill')
+    # Handle missing values - build the null mask once; the count is only
+    # computed on the rare path where something is actually missing
+    na = df.isna().to_numpy()
+    if na.any():
+        warnings.append(f"Found {int(na.sum())} missing values - filling with forward fill")
+        df.ffill(inplace=True)
+        df.bfill(inplace=True)
     
-    # Convert data types
+    # Convert data types (already parsed at read time on the fast path,
+    # so these only run for files that needed the fallback reader)
     try:
-        df['Date'] = pd.to_datetime(df['Date'])
-        df['Rainfall_mm'] = pd.to_numeric(df['Rainfall_mm'])
-        df['Crop_Growth_cm'] = pd.to_numeric(df['Crop_Growth_cm'])
+        if not is_datetime64_any_dtype(df['Date']):
+            df['Date'] = pd.to_datetime(df['Date'])
+        if not is_numeric_dtype(df['Rainfall_mm']):
+            df['Rainfall_mm'] = pd.to_numeric(df['Rainfall_mm'])
+        if not is_numeric_dtype(df['Crop_Growth_cm']):
+            df['Crop_Growth_cm'] = pd.to_numeric(df['Crop_Growth_cm'])
     except Exception as e:
         errors.append(f"Data type conversion failed: {str(e)}")
         return None, errors, warnings
-    
-    # Check for negative values
-    if (df['Rainfall_mm'] < 0).any():
+
+    # Quantize measurements to float32 - ample precision for field data and
+    # half the bytes in every downstream pass (lazy no-op under CoW on the
+    # typed CSV path)
+    df['Rainfall_mm'] = df['Rainfall_mm'].astype('float32')
+    df['Crop_Growth_cm'] = df['Crop_Growth_cm'].astype('float32')
+
+    # Check for negative values on the raw arrays (one scan per column)
+    rain = df['Rainfall_mm'].to_numpy()
+    if (rain < 0).any():
         warnings.append("Found negative rainfall values - setting to 0")
-        df.loc[df['Rainfall_mm'] < 0, 'Rainfall_mm'] = 0
-    
-    if (df['Crop_Growth_cm'] < 0).any():
+        df['Rainfall_mm'] = np.maximum(rain, 0)
+
+    growth_mask = df['Crop_Growth_cm'].to_numpy() >= 0
+    if not growth_mask.all():
         warnings.append("Found negative growth values - removing those rows")
-        df = df[df['Crop_Growth_cm'] >= 0]
-    
-    # Sort by date
-    df = df.sort_values('Date').reset_index(drop=True)
+        df = df.iloc[growth_mask]
     
+    # Sort by date - daily exports are usually already in order, and the
+    # monotonicity check is a cheap short-circuiting scan
+    if not df['Date'].is_monotonic_increasing:
+        df = df.sort_values('Date', kind='stable', ignore_index=True)
+
     return df, errors, warnings
 
 
-def calculate_statistics(df):
-    """Calculate key statistics"""
+def _nanmin(arr):
+    """Minimum via bottleneck's tight C loop when it is installed."""
+    return bn.nanmin(arr) if bn is not None else arr.min()
+
+
+def _stats_kernel_py(rain, growth):
+    """Fallback single-call reductions when numba is unavailable."""
+    rain = rain.astype(np.float64, copy=False)
+    growth = growth.astype(np.float64, copy=False)
+    if bn is not None:
+        # bottleneck's nansum/nanmax/ss are SIMD C loops without the
+        # pandas Series wrapping or NA-handling dispatch
+        return (len(rain), bn.nansum(rain), bn.nanmax(rain), bn.nansum(growth),
+                bn.nanmax(growth), bn.ss(rain), bn.ss(growth),
+                bn.nansum(rain * growth))
+    return (len(rain), rain.sum(), rain.max(), growth.sum(), growth.max(),
+            (rain * rain).sum(), (growth * growth).sum(), (rain * growth).sum())
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _stats_kernel(rain, growth):
+        """Fused single-pass sums/maxima for both columns.
+
+        One loop accumulates everything calculate_statistics and the trend
+        line need, so the arrays cross memory once instead of ~8 times.
+        """
+        n = rain.shape[0]
+        rsum = 0.0
+        gsum = 0.0
+        r2 = 0.0
+        g2 = 0.0
+        rg = 0.0
+        rmax = rain[0]
+        gmax = growth[0]
+        for i in range(n):
+            r = rain[i]
+            g = growth[i]
+            rsum += r
+            gsum += g
+            r2 += r * r
+            g2 += g * g
+            rg += r * g
+            if r > rmax:
+                rmax = r
+            if g > gmax:
+                gmax = g
+        return n, rsum, rmax, gsum, gmax, r2, g2, rg
+
+    # Warm up the JIT at import so the first upload doesn't pay compile cost
+    _stats_kernel(np.zeros(2, dtype=np.float32), np.zeros(2, dtype=np.float32))
+else:
+    _stats_kernel = _stats_kernel_py
+
+
+def _correlation_from_sums(n, rsum, gsum, r2, g2, rg):
+    """Pearson correlation computed in O(1) from the fused sums."""
+    denom = math.sqrt((n * r2 - rsum * rsum) * (n * g2 - gsum * gsum))
+    return (n * rg - rsum * gsum) / denom if denom else 0.0
+
+
+def calculate_statistics(dates, rain, growth):
+    """Calculate key statistics from the raw column arrays"""
+    n, rsum, rmax, gsum, gmax, r2, g2, rg = _stats_kernel(rain, growth)
+    # validate_data guarantees dates are sorted, so the range is O(1)
+    d0 = np.datetime_as_string(dates[0], unit='D')
+    d1 = np.datetime_as_string(dates[-1], unit='D')
     stats = {
-        'total_records': len(df),
-        'date_range': f"{df['Date'].min().strftime('%Y-%m-%d')} to {df['Date'].max().strftime('%Y-%m-%d')}",
-        'avg_rainfall': round(df['Rainfall_mm'].mean(), 2),
-        'max_rainfall': round(df['Rainfall_mm'].max(), 2),
-        'total_rainfall': round(df['Rainfall_mm'].sum(), 2),
-        'avg_growth': round(df['Crop_Growth_cm'].mean(), 2),
-        'max_growth': round(df['Crop_Growth_cm'].max(), 2),
-        'correlation': round(df['Rainfall_mm'].corr(df['Crop_Growth_cm']), 4),
+        'total_records': n,
+        'date_range': f"{d0} to {d1}",
+        'avg_rainfall': round(rsum / n, 2),
+        'max_rainfall': round(float(rmax), 2),
+        'total_rainfall': round(rsum, 2),
+        'avg_growth': round(gsum / n, 2),
+        'max_growth': round(float(gmax), 2),
+        'correlation': round(_correlation_from_sums(n, rsum, gsum, r2, g2, rg), 4),
     }
     return stats
 
 
-def create_visualizations(df):
-    """Create interactive Plotly visualizations"""
-    
-    # Create subplots
+# Plotly.js rendering degrades well before 100k points, so traces above
+# this size are decimated down to the target before serialization
+DOWNSAMPLE_THRESHOLD = 4000
+DOWNSAMPLE_TARGET = 2000
+
+
+def _lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets decimation.
+
+    Returns the indices of the n_out points that best preserve the visual
+    shape of (x, y). x must be sorted ascending.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = x.astype(np.float64, copy=False)
+    y = y.astype(np.float64, copy=False)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0] = 0
+    idx[-1] = n - 1
+
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Anchor: previously selected point; target: mean of the next bucket
+        ax, ay = x[idx[i]], y[idx[i]]
+        if i + 2 < n_out - 1:
+            bx = x[edges[i + 1]:edges[i + 2]].mean()
+            by = y[edges[i + 1]:edges[i + 2]].mean()
+        else:
+            bx, by = x[n - 1], y[n - 1]
+        # Pick the bucket point forming the largest triangle
+        area = np.abs((ax - x[lo:hi]) * (by - ay) - (ax - bx) * (y[lo:hi] - ay))
+        idx[i + 1] = lo + area.argmax()
+
+    return idx
+
+
+def _build_figure_template():
+    """Build the fixed dashboard scaffolding once at import time.
+
+    The subplot grid, trace styling and axis/layout configuration never
+    change between requests - only the trace data does - so per-request
+    work is reduced to cloning this template and filling in x/y.
+    """
     fig = make_subplots(
         rows=2, cols=2,
-        subplot_titles=("Daily Rainfall", "Daily Crop Growth", 
+        subplot_titles=("Daily Rainfall", "Daily Crop Growth",
                        "Rainfall vs Growth Correlation", "Weekly Trends"),
         specs=[[{"secondary_y": False}, {"secondary_y": False}],
                [{"secondary_y": False}, {"secondary_y": True}]]
     )
-    
+
     # Plot 1: Daily Rainfall (Bar chart)
     fig.add_trace(
-        go.Bar(x=df['Date'], y=df['Rainfall_mm'], name='Rainfall (mm)',
+        go.Bar(name='Rainfall (mm)',
                marker=dict(color='steelblue'), showlegend=True),
         row=1, col=1
     )
-    
+
     # Plot 2: Daily Crop Growth (Line chart)
     fig.add_trace(
-        go.Scatter(x=df['Date'], y=df['Crop_Growth_cm'], name='Growth (cm)',
+        go.Scattergl(name='Growth (cm)',
                    mode='lines+markers', line=dict(color='green', width=2),
                    fill='tozeroy', fillcolor='rgba(0, 128, 0, 0.2)', showlegend=True),
         row=1, col=2
     )
-    
+
     # Plot 3: Scatter plot with trend line
-    correlation = df['Rainfall_mm'].corr(df['Crop_Growth_cm'])
-    
     fig.add_trace(
-        go.Scatter(x=df['Rainfall_mm'], y=df['Crop_Growth_cm'], name='Data Points',
+        go.Scattergl(name='Data Points',
                    mode='markers', marker=dict(size=6, color='darkgreen', opacity=0.6),
                    showlegend=True),
         row=2, col=1
     )
-    
-    # Add trend line
-    z = np.polyfit(df['Rainfall_mm'], df['Crop_Growth_cm'], 1)
-    p = np.poly1d(z)
-    x_trend = np.linspace(df['Rainfall_mm'].min(), df['Rainfall_mm'].max(), 100)
-    
+
     fig.add_trace(
-        go.Scatter(x=x_trend, y=p(x_trend), name=f'Trend (R={correlation:.2f})',
+        go.Scattergl(name='Trend',
                    mode='lines', line=dict(color='red', width=2, dash='dash'),
                    showlegend=True),
         row=2, col=1
     )
-    
+
     # Plot 4: Weekly aggregates
-    weekly_data = df.set_index('Date').resample('W').agg({
-        'Rainfall_mm': 'sum',
-        'Crop_Growth_cm': 'mean'
-    }).reset_index()
-    
     fig.add_trace(
-        go.Bar(x=weekly_data['Date'], y=weekly_data['Rainfall_mm'], 
-               name='Weekly Rainfall (mm)', marker=dict(color='lightblue'),
+        go.Bar(name='Weekly Rainfall (mm)', marker=dict(color='lightblue'),
                showlegend=True),
         row=2, col=2
     )
-    
+
     fig.add_trace(
-        go.Scatter(x=weekly_data['Date'], y=weekly_data['Crop_Growth_cm'],
-                   name='Avg Weekly Growth (cm)', mode='lines+markers',
+        go.Scattergl(name='Avg Weekly Growth (cm)', mode='lines+markers',
                    line=dict(color='red', width=2), marker=dict(size=6),
                    showlegend=True),
         row=2, col=2, secondary_y=True
     )
-    
+
     # Update layout
     fig.update_layout(
         title_text="Agri-Tech Data Analysis Dashboard",
@@ -184,25 +382,84 @@ def create_visualizations(df):
         hovermode='x unified',
         plot_bgcolor='rgba(240,240,240,0.5)',
     )
-    
+
     fig.update_xaxes(title_text="Date", row=1, col=1, gridcolor='white')
     fig.update_xaxes(title_text="Date", row=1, col=2, gridcolor='white')
     fig.update_xaxes(title_text="Rainfall (mm)", row=2, col=1, gridcolor='white')
     fig.update_xaxes(title_text="Date", row=2, col=2, gridcolor='white')
-    
+
     fig.update_yaxes(title_text="Rainfall (mm)", row=1, col=1, gridcolor='white')
     fig.update_yaxes(title_text="Growth (cm)", row=1, col=2, gridcolor='white')
     fig.update_yaxes(title_text="Growth (cm)", row=2, col=1, gridcolor='white')
     fig.update_yaxes(title_text="Weekly Rainfall (mm)", row=2, col=2, gridcolor='white')
     fig.update_yaxes(title_text="Growth (cm)", row=2, col=2, secondary_y=True)
-    
-    return fig.to_html(include_plotlyjs='cdn')
+
+    return fig
+
+
+_FIGURE_TEMPLATE = _build_figure_template()
+
+
+def create_visualizations(dates, rain, growth):
+    """Create interactive Plotly visualizations from the raw column arrays"""
+
+    # Decimate the per-day traces for large uploads; statistics and the
+    # trend line below still use the full arrays
+    if len(dates) > DOWNSAMPLE_THRESHOLD:
+        t = dates.view('i8')
+        sel = _lttb_indices(t, rain, DOWNSAMPLE_TARGET)
+        bar_x, bar_y = dates[sel], rain[sel]
+        sel = _lttb_indices(t, growth, DOWNSAMPLE_TARGET)
+        line_x, line_y = dates[sel], growth[sel]
+        order = rain.argsort(kind='stable')
+        sel = order[_lttb_indices(rain[order], growth[order], DOWNSAMPLE_TARGET)]
+        scatter_x, scatter_y = rain[sel], growth[sel]
+    else:
+        bar_x = line_x = dates
+        bar_y, line_y = rain, growth
+        scatter_x, scatter_y = rain, growth
+
+    # Correlation and trend line from one fused pass - closed-form degree-1
+    # least squares, no Vandermonde matrix or LAPACK solve needed
+    n, rsum, rmax, gsum, gmax, r2, g2, rg = _stats_kernel(rain, growth)
+    correlation = _correlation_from_sums(n, rsum, gsum, r2, g2, rg)
+    var = n * r2 - rsum * rsum
+    slope = (n * rg - rsum * gsum) / var if var else 0.0
+    intercept = (gsum - slope * rsum) / n
+    x_trend = np.linspace(_nanmin(rain), rmax, 100)
+
+    # Weekly aggregates straight from the arrays - integer week ordinals
+    # plus bincount, no DataFrame involved so the function is thread-safe
+    week_id = dates.astype('datetime64[W]').view('i8')
+    uniq, inverse = np.unique(week_id, return_inverse=True)
+    counts = np.bincount(inverse)
+    weekly_rain = np.bincount(inverse, weights=rain)
+    weekly_growth = np.bincount(inverse, weights=growth) / counts
+    week_starts = uniq.astype('datetime64[W]')
+
+    # Clone the prebuilt scaffolding (copies, doesn't alias) and fill in
+    # the per-request trace data
+    fig = go.Figure(data=_FIGURE_TEMPLATE.data, layout=_FIGURE_TEMPLATE.layout)
+    daily_bar, growth_line, points, trend, weekly_bar, weekly_line = fig.data
+    daily_bar.x, daily_bar.y = bar_x, bar_y
+    growth_line.x, growth_line.y = line_x, line_y
+    points.x, points.y = scatter_x, scatter_y
+    trend.x, trend.y = x_trend, slope * x_trend + intercept
+    trend.name = f'Trend (R={correlation:.2f})'
+    weekly_bar.x, weekly_bar.y = week_starts, weekly_rain
+    weekly_line.x, weekly_line.y = week_starts, weekly_growth
+
+    # Ship the figure as JSON and let the page render it with Plotly.react;
+    # much smaller than a full to_html blob and the browser caches Plotly.js
+    return json.loads(fig.to_json())
 
 
 @app.route('/')
 def index():
     """Home page"""
-    return render_template('index.html')
+    # Pin the page's plotly.js to the version our fig.to_json() output
+    # targets - newer plotly.py emits typed arrays older bundles can't read
+    return render_template('index.html', plotlyjs_version=get_plotlyjs_version())
 
 
 @app.route('/analyze', methods=['POST'])
@@ -222,36 +479,38 @@ def analyze():
         return jsonify({'success': False, 'error': 'File must be CSV or Excel (xlsx/xls)'}), 400
     
     try:
-        # Save uploaded file
-        filename = secure_filename(file.filename)
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
-        
-        # Load data
-        df, error = load_data(filepath)
-        if error:
-            return jsonify({'success': False, 'error': f'Failed to load file: {error}'}), 400
-        
-        # Validate data
-        df, errors, warnings = validate_data(df)
-        if errors:
-            return jsonify({'success': False, 'error': ', '.join(errors)}), 400
-        
-        # Calculate statistics
-        stats = calculate_statistics(df)
-        
-        # Create visualizations
-        html_plot = create_visualizations(df)
-        
-        # Clean up uploaded file
-        os.remove(filepath)
-        
-        return jsonify({
-            'success': True,
-            'stats': stats,
-            'warnings': warnings,
-            'plot': html_plot
-        })
+        # Read the upload once; identical re-uploads are answered from the
+        # digest-keyed cache without touching pandas or Plotly at all
+        file.stream.seek(0)
+        file_bytes = file.stream.read()
+        digest = hashlib.blake2b(file_bytes, digest_size=16).hexdigest()
+        result = _analysis_cache_get(digest)
+
+        if result is None:
+            # Parse straight from memory - no disk write/read/unlink round-trip
+            df, error = load_data(io.BytesIO(file_bytes), filename=file.filename)
+            if error:
+                return jsonify({'success': False, 'error': f'Failed to load file: {error}'}), 400
+
+            # Validate data
+            df, errors, warnings = validate_data(df)
+            if errors:
+                return jsonify({'success': False, 'error': ', '.join(errors)}), 400
+
+            # Statistics and the figure only need the raw arrays and are
+            # independent of each other, so compute them concurrently
+            dates = df['Date'].to_numpy()
+            rain = df['Rainfall_mm'].to_numpy()
+            growth = df['Crop_Growth_cm'].to_numpy()
+            f_stats = EXECUTOR.submit(calculate_statistics, dates, rain, growth)
+            f_figure = EXECUTOR.submit(create_visualizations, dates, rain, growth)
+            stats = f_stats.result()
+            figure = f_figure.result()
+
+            result = {'stats': stats, 'warnings': warnings, 'figure': figure}
+            _analysis_cache_put(digest, result)
+
+        return jsonify({'success': True, **result})
     
     except Exception as e:
         return jsonify({'success': False, 'error': f'An error occurred: {str(e)}'}), 500
@@ -268,4 +527,8 @@ def download_template():
 
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
+    # Development entry point only - Werkzeug serves one request at a time.
+    # In production run the app under gunicorn (see Procfile) so uploads
+    # parse in parallel across workers and threads.
+    import os
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', port=5000)